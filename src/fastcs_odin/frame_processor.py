@@ -11,6 +11,8 @@ from fastcs_odin.odin_adapter_controller import (
 from fastcs_odin.odin_data import OdinDataAdapterController, OdinDataController
 from fastcs_odin.util import OdinParameter, partition
 
+FP_SUB_CONTROLLER_PATTERN = re.compile(r"FP\d+")
+
 
 class FrameProcessorController(OdinDataController):
     """Sub controller for a frame processor application."""
@@ -56,20 +58,26 @@ class FrameProcessorController(OdinDataController):
 class FrameProcessorAdapterController(OdinDataAdapterController):
     frames_written: AttrR = AttrR(
         Int(),
-        handler=StatusSummaryUpdater([re.compile("FP*"), "HDF"], "frames_written", sum),
+        handler=StatusSummaryUpdater(
+            [FP_SUB_CONTROLLER_PATTERN, "HDF"], "frames_written", sum
+        ),
     )
     writing: AttrR = AttrR(
         Bool(),
-        handler=StatusSummaryUpdater([re.compile("FP*"), "HDF"], "writing", any),
+        handler=StatusSummaryUpdater(
+            [FP_SUB_CONTROLLER_PATTERN, "HDF"], "writing", any
+        ),
+    )
+    _unique_config = frozenset(
+        {
+            "rank",
+            "number",
+            "ctrl_endpoint",
+            "meta_endpoint",
+            "fr_ready_cnxn",
+            "fr_release_cnxn",
+        }
     )
-    _unique_config = [
-        "rank",
-        "number",
-        "ctrl_endpoint",
-        "meta_endpoint",
-        "fr_ready_cnxn",
-        "fr_release_cnxn",
-    ]
     _subcontroller_label = "FP"
     _subcontroller_cls = FrameProcessorController
 
@@ -14,8 +14,6 @@ from fastcs_odin.util import OdinParameter
 
 types = {"float": Float(), "int": Int(), "bool": Bool(), "str": String()}
 
-REQUEST_METADATA_HEADER = {"Accept": "application/json;metadata=true"}
-
 
 class AdapterResponseError(Exception): ...
 
@@ -131,9 +129,9 @@ def _filter_sub_controllers(
             sub_controllers = tuple(sub_controller_map[k] for k in keys)
         case pattern:
             sub_controllers = tuple(
-                sub_controller_map[k]
-                for k in sub_controller_map.keys()
-                if pattern.match(k)
+                sub_controller
+                for name, sub_controller in sub_controller_map.items()
+                if pattern.fullmatch(name)
             )
 
     for sub_controller in sub_controllers:
@@ -188,7 +186,7 @@ class OdinAdapterController(SubController):
                 attr_class = AttrR
 
             if parameter.metadata["type"] not in types:
-                logging.warning(f"Could not handle parameter {parameter}")
+                logging.warning("Could not handle parameter %s", parameter)
                 # this is really something I should handle here
                 continue
 
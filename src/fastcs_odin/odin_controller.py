@@ -1,6 +1,5 @@
 from fastcs.connections.ip_connection import IPConnectionSettings
 from fastcs.controller import Controller
-from fastcs.datatypes import Bool, Float, Int, String
 
 from fastcs_odin.eiger_fan import EigerFanAdapterController
 from fastcs_odin.frame_processor import FrameProcessorAdapterController
@@ -10,18 +9,20 @@ from fastcs_odin.meta_writer import MetaWriterAdapterController
 from fastcs_odin.odin_adapter_controller import OdinAdapterController
 from fastcs_odin.util import AdapterType, OdinParameter, create_odin_parameters
 
-types = {"float": Float(), "int": Int(), "bool": Bool(), "str": String()}
-
 REQUEST_METADATA_HEADER = {"Accept": "application/json;metadata=true"}
 
 
-class AdapterResponseError(Exception): ...
-
-
 class OdinController(Controller):
     """A root ``Controller`` for an odin control server."""
 
     API_PREFIX = "api/0.1"
+    ADAPTER_CONTROLLERS: dict[str, type[OdinAdapterController]] = {
+        AdapterType.FRAME_PROCESSOR: FrameProcessorAdapterController,
+        AdapterType.FRAME_RECEIVER: FrameReceiverAdapterController,
+        AdapterType.META_WRITER: MetaWriterAdapterController,
+        AdapterType.EIGER_FAN: EigerFanAdapterController,
+    }
+    """Sub controller types for adapter modules; other modules are generic."""
 
     def __init__(self, settings: IPConnectionSettings) -> None:
         super().__init__()
@@ -74,27 +75,8 @@ class OdinController(Controller):
     ) -> OdinAdapterController:
         """Create a sub controller for an adapter in an odin control server."""
 
-        match module:
-            case AdapterType.FRAME_PROCESSOR:
-                return FrameProcessorAdapterController(
-                    connection, parameters, f"{self.API_PREFIX}/{adapter}"
-                )
-            case AdapterType.FRAME_RECEIVER:
-                return FrameReceiverAdapterController(
-                    connection, parameters, f"{self.API_PREFIX}/{adapter}"
-                )
-            case AdapterType.META_WRITER:
-                return MetaWriterAdapterController(
-                    connection, parameters, f"{self.API_PREFIX}/{adapter}"
-                )
-            case AdapterType.EIGER_FAN:
-                return EigerFanAdapterController(
-                    connection, parameters, f"{self.API_PREFIX}/{adapter}"
-                )
-            case _:
-                return OdinAdapterController(
-                    connection, parameters, f"{self.API_PREFIX}/{adapter}"
-                )
+        controller_type = self.ADAPTER_CONTROLLERS.get(module, OdinAdapterController)
+        return controller_type(connection, parameters, f"{self.API_PREFIX}/{adapter}")
 
     async def connect(self) -> None:
         self.connection.open()
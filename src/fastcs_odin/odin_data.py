@@ -17,7 +17,7 @@ class OdinDataController(OdinAdapterController):
         )
         if invalid:
             invalid_names = ["/".join(param.uri) for param in invalid]
-            logging.warning(f"Removing parameters with invalid names: {invalid_names}")
+            logging.warning("Removing parameters with invalid names: %s", invalid_names)
 
     def _process_parameters(self):
         self._remove_metadata_fields_paths()
@@ -31,7 +31,7 @@ class OdinDataController(OdinAdapterController):
 class OdinDataAdapterController(OdinAdapterController):
     """Sub controller for the frame processor adapter in an odin control server."""
 
-    _unique_config: list[str] = []
+    _unique_config: frozenset[str] = frozenset()
     _subcontroller_label: str = "OD"
     _subcontroller_cls: type[OdinDataController] = OdinDataController
 
@@ -40,12 +40,12 @@ class OdinDataAdapterController(OdinAdapterController):
             self.parameters, lambda p: p.uri[0].isdigit()
         )
 
-        while idx_parameters:
-            idx = idx_parameters[0].uri[0]
-            fp_parameters, idx_parameters = partition(
-                idx_parameters, lambda p, idx=idx: p.uri[0] == idx
-            )
+        # Group parameters by index in a single pass, in order of first appearance
+        parameters_by_idx: dict[str, list[OdinParameter]] = {}
+        for parameter in idx_parameters:
+            parameters_by_idx.setdefault(parameter.uri[0], []).append(parameter)
 
+        for idx, fp_parameters in parameters_by_idx.items():
             adapter_controller = self._subcontroller_cls(
                 self.connection,
                 fp_parameters,
@@ -67,26 +67,29 @@ class OdinDataAdapterController(OdinAdapterController):
                 case OdinAdapterController():
                     for parameter in sub_controller.parameters:
                         mode, key = parameter.uri[0], parameter.uri[-1]
-                        if mode == "config" and key not in self._unique_config:
-                            try:
-                                attr: AttrW = sub_controller.attributes[parameter.name]  # type: ignore
-                                if parameter.name not in parameter_attribute_map:
-                                    parameter_attribute_map[parameter.name] = (
-                                        parameter,
-                                        [attr],
-                                    )
-                                else:
-                                    parameter_attribute_map[parameter.name][1].append(
-                                        attr
-                                    )
-                            except KeyError:
-                                logging.warning(
-                                    f"Controller has parameter {parameter}, "
-                                    f"but no corresponding attribute {parameter.name}"
-                                )
+                        if mode != "config" or key in self._unique_config:
+                            continue
+
+                        attr: AttrW | None = sub_controller.attributes.get(  # type: ignore
+                            parameter.name
+                        )
+                        if attr is None:
+                            logging.warning(
+                                "Controller has parameter %s, "
+                                "but no corresponding attribute %s",
+                                parameter,
+                                parameter.name,
+                            )
+                        elif parameter.name not in parameter_attribute_map:
+                            parameter_attribute_map[parameter.name] = (
+                                parameter,
+                                [attr],
+                            )
+                        else:
+                            parameter_attribute_map[parameter.name][1].append(attr)
                 case _:
                     logging.warning(
-                        f"Subcontroller {sub_controller} not an OdinAdapterController"
+                        "Subcontroller %s not an OdinAdapterController", sub_controller
                     )
 
         for parameter, sub_attributes in parameter_attribute_map.values():
@@ -1,13 +1,16 @@
-from collections.abc import Callable, Iterable, Iterator, Mapping
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, TypeVar
 
 from fastcs.controller import BaseController, SubController
 
+METADATA_KEYS = frozenset(("writeable", "type"))
+
 
 def is_metadata_object(v: Any) -> bool:
-    return isinstance(v, dict) and "writeable" in v and "type" in v
+    return isinstance(v, dict) and METADATA_KEYS <= v.keys()
 
 
 class AdapterType(str, Enum):
@@ -17,7 +20,7 @@ class AdapterType(str, Enum):
     EIGER_FAN = "EigerFanAdapter"
 
 
-@dataclass
+@dataclass(slots=True)
 class OdinParameter:
     uri: list[str]
     """Full URI."""
@@ -51,72 +54,105 @@ def create_odin_parameters(metadata: Mapping[str, Any]) -> list[OdinParameter]:
         List of ``OdinParameter``
 
     """
-    return [
-        OdinParameter(uri=uri, metadata=metadata)
-        for uri, metadata in _walk_odin_metadata(metadata, [])
-    ]
+    return _walk_odin_metadata(metadata, [])
 
 
 def _walk_odin_metadata(
     tree: Mapping[str, Any], path: list[str]
-) -> Iterator[tuple[list[str], dict[str, Any]]]:
-    """Walk through tree and yield the leaves and their paths.
+) -> list[OdinParameter]:
+    """Walk through tree and create parameters for the leaves.
+
+    The tree is walked depth first using an explicit stack of iterators over the
+    branches, so the parameters are returned in the same order as the leaves appear in
+    the tree. Paths are built as tuples while walking and only copied to lists for the
+    leaves.
 
     Args:
         tree: Tree to walk
         path: Path down tree so far
 
     Returns:
-        (path to leaf, value of leaf)
+        List of ``OdinParameter`` with the path to and metadata of each leaf
 
     """
-    for node_name, node_value in tree.items():
-        node_path = path + [node_name]
-
-        # Branches - dict or list[dict] to recurse through
-        if isinstance(node_value, dict) and not is_metadata_object(node_value):
-            yield from _walk_odin_metadata(node_value, node_path)
-        elif (
-            isinstance(node_value, list)
-            and node_value  # Exclude parameters with an empty list as a value
-            and all(isinstance(m, dict) for m in node_value)
-        ):
-            for idx, sub_node in enumerate(node_value):
-                sub_node_path = node_path + [str(idx)]
-                yield from _walk_odin_metadata(sub_node, sub_node_path)
-        else:
-            # Leaves
-            if isinstance(node_value, dict) and is_metadata_object(node_value):
-                yield (node_path, node_value)
+    parameters: list[OdinParameter] = []
+    # Each branch also records whether it is under a config node, so that leaves do
+    # not have to search their full path to determine if they are writeable
+    stack: deque[tuple[Iterator[tuple[str, Any]], tuple[str, ...], bool]] = deque(
+        [(iter(tree.items()), tuple(path), "config" in path)]
+    )
+    while stack:
+        nodes, branch_path, branch_in_config = stack[-1]
+        for node_name, node_value in nodes:
+            node_path = branch_path + (node_name,)
+            in_config = branch_in_config or node_name == "config"
+
+            # Check the type of each node once and then decide whether it is a branch
+            # to descend into before continuing, or a leaf
+            if isinstance(node_value, dict):
+                if is_metadata_object(node_value):
+                    parameters.append(OdinParameter(list(node_path), node_value))
+                elif node_value:
+                    stack.append((iter(node_value.items()), node_path, in_config))
+                    break
+                # Nothing to walk in an empty branch, so continue with its siblings
             elif isinstance(node_value, list):
-                if "config" in node_path:
+                if (
+                    node_value  # Exclude parameters with an empty list as a value
+                    # Check first element before scanning so that value lists exit early
+                    and isinstance(node_value[0], dict)
+                    and all(isinstance(m, dict) for m in node_value)
+                ):
+                    # Push in reverse so that the first sub node is walked first
+                    stack.extend(
+                        (iter(sub_node.items()), node_path + (str(idx),), in_config)
+                        for idx, sub_node in reversed(list(enumerate(node_value)))
+                    )
+                    break
+                elif in_config:
                     # Split list into separate parameters so they can be set
                     for idx, sub_node_value in enumerate(node_value):
-                        sub_node_path = node_path + [str(idx)]
-                        yield (
-                            sub_node_path,
-                            infer_metadata(sub_node_value, sub_node_path),
+                        sub_node_path = [*node_path, str(idx)]
+                        parameters.append(
+                            OdinParameter(
+                                sub_node_path,
+                                infer_metadata(sub_node_value, writeable=in_config),
+                            )
                         )
                 else:
                     # Convert read-only list to a string for display
-                    yield (node_path, infer_metadata(str(node_value), node_path))
+                    parameters.append(
+                        OdinParameter(
+                            list(node_path),
+                            infer_metadata(str(node_value), writeable=in_config),
+                        )
+                    )
             else:
                 # TODO: This won't be needed when all parameters provide metadata
-                yield (node_path, infer_metadata(node_value, node_path))
+                parameters.append(
+                    OdinParameter(
+                        list(node_path), infer_metadata(node_value, writeable=in_config)
+                    )
+                )
+        else:
+            # All nodes in this branch have been walked
+            stack.pop()
+
+    return parameters
 
 
-def infer_metadata(parameter: Any, uri: list[str]):
-    """Create metadata for a parameter from its type and URI.
+def infer_metadata(parameter: Any, *, writeable: bool):
+    """Create metadata for a parameter from its type.
 
     Args:
         parameter: Value of parameter to create metadata for
-        uri: URI of parameter in API
+        writeable: Whether the parameter is writeable, i.e. it is under a config node
 
     """
     return {
         "value": parameter,
         "type": type(parameter).__name__,
-        "writeable": "config" in uri,
+        "writeable": writeable,
     }
 
 
@@ -153,12 +189,21 @@ def partition(
 def get_all_sub_controllers(
     controller: BaseController,
 ) -> list[SubController]:
-    return list(_walk_sub_controllers(controller))
+    """Get all sub controllers below a controller, depth first.
 
+    Args:
+        controller: Controller to get sub controllers of
 
-def _walk_sub_controllers(
-    controller: BaseController,
-) -> Iterable[SubController]:
-    for sub_controller in controller.get_sub_controllers().values():
-        yield sub_controller
-        yield from _walk_sub_controllers(sub_controller)
+    Returns:
+        List of ``SubController``, each followed by its own sub controllers
+
+    """
+    sub_controllers: list[SubController] = []
+    # Push children in reverse so they are popped in registration order
+    stack = deque(reversed(controller.get_sub_controllers().values()))
+    while stack:
+        sub_controller = stack.pop()
+        sub_controllers.append(sub_controller)
+        stack.extend(reversed(sub_controller.get_sub_controllers().values()))
+
+    return sub_controllers
@@ -1,8 +1,12 @@
+import json
 import os
+from pathlib import Path
 from typing import Any
 
 import pytest
 
+INPUT = Path(__file__).parent / "input"
+
 # Prevent pytest from catching exceptions when debugging in vscode so that break on
 # exception works correctly (see: https://github.com/pytest-dev/pytest/issues/7409)
 if os.getenv("PYTEST_RAISE", "0") == "1":
@@ -19,3 +23,23 @@ if os.getenv("PYTEST_RAISE", "0") == "1":
     @pytest.hookimpl(tryfirst=True)
     def pytest_internalerror(excinfo: pytest.ExceptionInfo[Any]):
         raise excinfo.value
+
+
+def _load_response(name: str) -> dict[str, Any]:
+    # Responses are loaded once per session and shared, so tests must not modify them
+    return json.loads((INPUT / name).read_bytes())
+
+
+@pytest.fixture(scope="session")
+def one_node_fp_response() -> dict[str, Any]:
+    return _load_response("one_node_fp_response.json")
+
+
+@pytest.fixture(scope="session")
+def two_node_fp_response() -> dict[str, Any]:
+    return _load_response("two_node_fp_response.json")
+
+
+@pytest.fixture(scope="session")
+def two_node_fr_response() -> dict[str, Any]:
+    return _load_response("two_node_fr_response.json")
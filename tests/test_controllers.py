@@ -1,6 +1,3 @@
-import re
-from pathlib import Path
-
 import pytest
 from fastcs.attributes import AttrR, AttrRW
 from fastcs.connections.ip_connection import IPConnectionSettings
@@ -9,6 +6,7 @@ from pytest_mock import MockerFixture
 
 from fastcs_odin.eiger_fan import EigerFanAdapterController
 from fastcs_odin.frame_processor import (
+    FP_SUB_CONTROLLER_PATTERN,
     FrameProcessorAdapterController,
     FrameProcessorController,
     FrameProcessorPluginController,
@@ -28,8 +26,6 @@ from fastcs_odin.odin_adapter_controller import (
 from fastcs_odin.odin_controller import OdinAdapterController, OdinController
 from fastcs_odin.util import AdapterType, OdinParameter
 
-HERE = Path(__file__).parent
-
 
 def test_create_attributes():
     parameters = [
@@ -73,39 +69,66 @@ def test_fp_process_parameters():
     ]
 
 
-@pytest.mark.asyncio
-async def test_create_adapter_controller(mocker: MockerFixture):
+@pytest.fixture
+def odin_controller(mocker: MockerFixture):
+    """OdinController with an awaitable connection ``get`` and ``close``."""
     controller = OdinController(IPConnectionSettings("", 0))
-    controller.connection = mocker.AsyncMock()
+    controller.connection = mocker.MagicMock()
+    controller.connection.get = mocker.AsyncMock()
+    controller.connection.close = mocker.AsyncMock()
+    return controller
+
+
+@pytest.mark.parametrize(
+    "adapter, module, expected_controller",
+    (
+        ("fp", AdapterType.FRAME_PROCESSOR, FrameProcessorAdapterController),
+        ("fr", AdapterType.FRAME_RECEIVER, FrameReceiverAdapterController),
+        ("mw", AdapterType.META_WRITER, MetaWriterAdapterController),
+        ("ef", AdapterType.EIGER_FAN, EigerFanAdapterController),
+        ("od", "OtherAdapter", OdinAdapterController),
+    ),
+    ids=("frame_processor", "frame_receiver", "meta_writer", "eiger_fan", "generic"),
+)
+def test_create_adapter_controller(
+    odin_controller, adapter: str, module: str, expected_controller: type
+):
     parameters = [OdinParameter(["0"], metadata={})]
 
-    ctrl = controller._create_adapter_controller(
-        controller.connection, parameters, "fp", AdapterType.FRAME_PROCESSOR
+    ctrl = odin_controller._create_adapter_controller(
+        odin_controller.connection, parameters, adapter, module
     )
-    assert isinstance(ctrl, FrameProcessorAdapterController)
+    assert isinstance(ctrl, expected_controller)
 
-    ctrl = controller._create_adapter_controller(
-        controller.connection, parameters, "fr", AdapterType.FRAME_RECEIVER
-    )
-    assert isinstance(ctrl, FrameReceiverAdapterController)
 
-    ctrl = controller._create_adapter_controller(
-        controller.connection, parameters, "mw", AdapterType.META_WRITER
+@pytest.mark.parametrize(
+    "module, expected_controller",
+    (
+        ("OtherAdapter", OdinAdapterController),
+        (AdapterType.META_WRITER.value, MetaWriterAdapterController),
+        (AdapterType.EIGER_FAN.value, EigerFanAdapterController),
+    ),
+    ids=("generic", "meta_writer", "eiger_fan"),
+)
+async def test_controller_initialise(
+    odin_controller, module: str, expected_controller: type
+):
+    controller = odin_controller
+    controller.connection.get.side_effect = (
+        {"adapters": ["test", "od"]},
+        {"module": {"value": module}},
+        {"module": {"value": "OtherAdapter"}},
     )
-    assert isinstance(ctrl, MetaWriterAdapterController)
 
-    ctrl = controller._create_adapter_controller(
-        controller.connection, parameters, "ef", AdapterType.EIGER_FAN
-    )
-    assert isinstance(ctrl, EigerFanAdapterController)
+    await controller.initialise()
 
-    ctrl = controller._create_adapter_controller(
-        controller.connection, parameters, "od", "OtherAdapter"
-    )
-    assert isinstance(ctrl, OdinAdapterController)
+    sub_controllers = controller.get_sub_controllers()
+    assert list(sub_controllers) == ["TEST", "OD"]
+    assert type(sub_controllers["TEST"]) is expected_controller
+    assert type(sub_controllers["OD"]) is OdinAdapterController
+    controller.connection.close.assert_awaited_once()
 
 
-@pytest.mark.asyncio
 async def test_fp_create_plugin_sub_controllers():
     parameters = [
         OdinParameter(
@@ -163,99 +186,115 @@ async def test_fp_create_plugin_sub_controllers():
             pytest.fail("Sub controllers not as expected")
 
 
-@pytest.mark.asyncio
-async def test_param_tree_handler_update(mocker: MockerFixture):
-    controller = mocker.AsyncMock()
+@pytest.fixture
+def mock_controller(mocker: MockerFixture):
+    """Mock controller with an awaitable connection."""
+    return mocker.AsyncMock()
+
+
+async def test_param_tree_handler_update(mocker: MockerFixture, mock_controller):
     attr = mocker.MagicMock()
 
     handler = ParamTreeHandler("hdf/frames_written")
 
-    controller.connection.get.return_value = {"frames_written": 20}
-    await handler.update(controller, attr)
+    mock_controller.connection.get.return_value = {"frames_written": 20}
+    await handler.update(mock_controller, attr)
     attr.set.assert_called_once_with(20)
 
 
-@pytest.mark.asyncio
-async def test_param_tree_handler_update_exception(mocker: MockerFixture):
-    controller = mocker.AsyncMock()
+async def test_param_tree_handler_update_exception(
+    mocker: MockerFixture, mock_controller
+):
     attr = mocker.MagicMock()
 
     handler = ParamTreeHandler("hdf/frames_written")
 
-    controller.connection.get.return_value = {"frames_wroted": 20}
+    mock_controller.connection.get.return_value = {"frames_wroted": 20}
     error_mock = mocker.patch("fastcs_odin.odin_adapter_controller.logging.error")
-    await handler.update(controller, attr)
+    await handler.update(mock_controller, attr)
     error_mock.assert_called_once_with(
         "Update loop failed for %s:\n%s", "hdf/frames_written", mocker.ANY
     )
 
 
-@pytest.mark.asyncio
-async def test_param_tree_handler_put(mocker: MockerFixture):
-    controller = mocker.MagicMock()
+async def test_param_tree_handler_put(mocker: MockerFixture, mock_controller):
     attr = mocker.MagicMock()
 
     handler = ParamTreeHandler("hdf/frames")
 
     # Test put
-    await handler.put(controller, attr, 10)
-    controller.connection.put.assert_called_once_with("hdf/frames", 10)
+    await handler.put(mock_controller, attr, 10)
+    mock_controller.connection.put.assert_awaited_once_with("hdf/frames", 10)
 
 
-@pytest.mark.asyncio
-async def test_param_tree_handler_put_exception(mocker: MockerFixture):
-    controller = mocker.AsyncMock()
+async def test_param_tree_handler_put_exception(mocker: MockerFixture, mock_controller):
     attr = mocker.MagicMock()
 
     handler = ParamTreeHandler("hdf/frames")
 
-    controller.connection.put.return_value = {"error": "No, you can't do that"}
+    mock_controller.connection.put.return_value = {"error": "No, you can't do that"}
     error_mock = mocker.patch("fastcs_odin.odin_adapter_controller.logging.error")
-    await handler.put(controller, attr, -1)
+    await handler.put(mock_controller, attr, -1)
     error_mock.assert_called_once_with(
         "Put %s = %s failed:\n%s", "hdf/frames", -1, mocker.ANY
     )
 
 
-@pytest.mark.asyncio
-async def test_status_summary_updater(mocker: MockerFixture):
+@pytest.fixture
+def status_summary_controllers(mocker: MockerFixture):
+    """Mock controller tree with one HDF controller under both FP0 and FP1.
+
+    The FR0 and FP0X controllers next to them do not match the FP pattern.
+    """
     controller = mocker.MagicMock()
     od_controller = mocker.MagicMock()
     fp_controller = mocker.MagicMock()
     fpx_controller = mocker.MagicMock()
     hdf_controller = mocker.MagicMock()
-    attr = mocker.AsyncMock()
+    other_controller = mocker.MagicMock()
 
     controller.get_sub_controllers.return_value = {"OD": od_controller}
     od_controller.get_sub_controllers.return_value = {"FP": fp_controller}
     fp_controller.get_sub_controllers.return_value = {
         "FP0": fpx_controller,
         "FP1": fpx_controller,
+        "FR0": other_controller,
+        "FP0X": other_controller,
     }
     fpx_controller.get_sub_controllers.return_value = {"HDF": hdf_controller}
 
-    hdf_controller.attributes["frames_written"].get.return_value = 50
+    return controller, hdf_controller, other_controller
 
-    handler = StatusSummaryUpdater(
-        ["OD", ("FP",), re.compile("FP*"), "HDF"], "frames_written", sum
-    )
-    await handler.update(controller, attr)
-    attr.set.assert_called_once_with(100)
 
-    handler = StatusSummaryUpdater(
-        ["OD", ("FP",), re.compile("FP*"), "HDF"], "writing", any
-    )
+@pytest.mark.parametrize(
+    "attribute_name, accumulator, values, expected",
+    [
+        ("frames_written", sum, [50, 50], 100),
+        ("writing", any, [True, False], True),
+        ("writing", any, [False, False], False),
+    ],
+)
+async def test_status_summary_updater(
+    mocker: MockerFixture,
+    status_summary_controllers,
+    attribute_name,
+    accumulator,
+    values,
+    expected,
+):
+    controller, hdf_controller, other_controller = status_summary_controllers
+    attr = mocker.AsyncMock()
 
-    hdf_controller.attributes["writing"].get.side_effect = [True, False]
-    await handler.update(controller, attr)
-    attr.set.assert_called_with(True)
+    hdf_controller.attributes[attribute_name].get.side_effect = values
 
-    hdf_controller.attributes["writing"].get.side_effect = [False, False]
+    handler = StatusSummaryUpdater(
+        ["OD", ("FP",), FP_SUB_CONTROLLER_PATTERN, "HDF"], attribute_name, accumulator
+    )
     await handler.update(controller, attr)
-    attr.set.assert_called_with(False)
+    attr.set.assert_called_once_with(expected)
+    other_controller.get_sub_controllers.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_config_fan_sender(mocker: MockerFixture):
     controller = mocker.MagicMock()
     attr = mocker.MagicMock(AttrRW)
@@ -270,7 +309,6 @@ async def test_config_fan_sender(mocker: MockerFixture):
     attr.set.assert_called_once_with(10)
 
 
-@pytest.mark.asyncio
 async def test_frame_reciever_controllers():
     valid_non_decoder_parameter = OdinParameter(
         uri=["0", "status", "buffers", "total"],
@@ -298,7 +336,6 @@ async def test_frame_reciever_controllers():
         HTTPConnection("", 0), parameters, "api/0.1"
     )
     await fr_controller.initialise()
-    assert isinstance(fr_controller, FrameReceiverController)
     assert valid_non_decoder_parameter in fr_controller.parameters
     assert len(fr_controller.parameters) == 1
     assert "DECODER" in fr_controller.get_sub_controllers()
@@ -0,0 +1,30 @@
+import math
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from fastcs_odin.http_connection import HTTPConnection
+
+
+async def test_get_non_finite_floats_and_big_ints():
+    # odin-control serialises responses with allow_nan=True
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(
+            text='{"nan": NaN, "inf": Infinity, "big": 123456789012345678901234567890}',
+            content_type="application/json",
+        )
+
+    app = web.Application()
+    app.router.add_get("/api/0.1/test", handler)
+    async with TestServer(app) as server:
+        assert server.port is not None
+        connection = HTTPConnection(server.host, server.port)
+        connection.open()
+        try:
+            response = await connection.get("api/0.1/test")
+        finally:
+            await connection.close()
+
+    assert isinstance(response["nan"], float) and math.isnan(response["nan"])
+    assert response["inf"] == math.inf
+    assert response["big"] == 123456789012345678901234567890
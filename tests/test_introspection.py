@@ -1,7 +1,5 @@
-import json
-from pathlib import Path
+from typing import Any
 
-import pytest
 from pytest_mock import MockerFixture
 
 from fastcs_odin.frame_processor import (
@@ -12,37 +10,31 @@ from fastcs_odin.frame_receiver import (
     FrameReceiverAdapterController,
     FrameReceiverController,
 )
-from fastcs_odin.util import create_odin_parameters
+from fastcs_odin.util import OdinParameter, create_odin_parameters
 
-HERE = Path(__file__).parent
 
-
-def test_one_node_fp():
-    with (HERE / "input/one_node_fp_response.json").open() as f:
-        response = json.loads(f.read())
-
-    parameters = create_odin_parameters(response)
+def test_one_node_fp(one_node_fp_response: dict[str, Any]):
+    parameters = create_odin_parameters(one_node_fp_response)
     assert len(parameters) == 97
 
 
-def test_two_node_fp():
-    with (HERE / "input/two_node_fp_response.json").open() as f:
-        response = json.loads(f.read())
-
-    parameters = create_odin_parameters(response)
+def test_two_node_fp(two_node_fp_response: dict[str, Any]):
+    parameters = create_odin_parameters(two_node_fp_response)
     assert len(parameters) == 190
 
 
-@pytest.mark.asyncio
-async def test_fp_initialise(mocker: MockerFixture):
-    with (HERE / "input/two_node_fp_response.json").open() as f:
-        response = json.loads(f.read())
-
-    async def get_plugins(idx: int):
-        return response[str(idx)]["status"]["plugins"]
+async def test_fp_initialise(
+    mocker: MockerFixture, two_node_fp_response: dict[str, Any]
+):
+    response = two_node_fp_response
 
     mock_connection = mocker.MagicMock()
-    mock_connection.get.side_effect = [get_plugins(0), get_plugins(1)]
+    mock_connection.get = mocker.AsyncMock(
+        side_effect=(
+            response["0"]["status"]["plugins"],
+            response["1"]["status"]["plugins"],
+        )
+    )
 
     parameters = create_odin_parameters(response)
     controller = FrameProcessorAdapterController(mock_connection, parameters, "prefix")
@@ -54,22 +46,17 @@ async def test_fp_initialise(mocker: MockerFixture):
     )
 
 
-def test_two_node_fr():
-    with (HERE / "input/two_node_fr_response.json").open() as f:
-        response = json.loads(f.read())
-
-    parameters = create_odin_parameters(response)
+def test_two_node_fr(two_node_fr_response: dict[str, Any]):
+    parameters = create_odin_parameters(two_node_fr_response)
     assert len(parameters) == 82
 
 
-@pytest.mark.asyncio
-async def test_fr_initialise(mocker: MockerFixture):
-    with (HERE / "input/two_node_fr_response.json").open() as f:
-        response = json.loads(f.read())
-
+async def test_fr_initialise(
+    mocker: MockerFixture, two_node_fr_response: dict[str, Any]
+):
     mock_connection = mocker.MagicMock()
 
-    parameters = create_odin_parameters(response)
+    parameters = create_odin_parameters(two_node_fr_response)
     controller = FrameReceiverAdapterController(mock_connection, parameters, "prefix")
     await controller.initialise()
     assert all(frx in controller.get_sub_controllers() for frx in ("FR0", "FR1"))
@@ -103,3 +90,34 @@ def test_config_node_splits_list_into_mutiples():
     data = {"config": {"param": [1, 2]}}
     parameters = create_odin_parameters(data)
     assert len(parameters) == 2
+
+
+def test_leaves_are_returned_in_tree_order():
+    data = {"a": [{"x": 1}, {"y": {"z": 2}}], "b": {"c": 3}, "d": 4}
+    parameters = create_odin_parameters(data)
+    assert [p.name for p in parameters] == ["a_0_x", "a_1_y_z", "b_c", "d"]
+
+
+def test_parameters_under_config_are_writeable():
+    data = {"config": {"nested": {"param": 1}}, "status": {"param": 2}}
+    parameters = create_odin_parameters(data)
+    assert [p.metadata["writeable"] for p in parameters] == [True, False]
+
+
+def test_parameter_name_is_updated_with_path():
+    parameter = OdinParameter(uri=["0", "status", "hdf", "frames"], metadata={})
+    assert parameter.name == "0_status_hdf_frames"
+
+    parameter.uri = parameter.uri[1:]
+    assert parameter.name == "status_hdf_frames"
+
+    parameter.uri.append("written")
+    assert parameter.name == "status_hdf_frames_written"
+
+    parameter.set_path(["hdf", "frames_written"])
+    assert parameter.name == "hdf_frames_written"
+
+
+def test_empty_node_has_no_parameters():
+    parameters = create_odin_parameters({"empty": {}, "count": 1})
+    assert [p.name for p in parameters] == ["count"]